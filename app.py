@@ -9,8 +9,15 @@
 
 # Imports
 import streamlit as st
-from string import ascii_lowercase, ascii_uppercase, digits, punctuation
-from generator import PasswordGenerator
+from types import SimpleNamespace
+from string import punctuation
+from generator import (
+    PasswordGenerator, validate_custom_characters,
+    VALID, DUPLICATED, EMPTY, ALPHANUMERIC,
+)
+
+# The version of this app.
+VERSION = '1.0.0'
 
 # ===== ===== ===== ===== ===== ===== ===== =====
 # Initiate the streamlit application.
@@ -20,29 +27,88 @@ st.set_page_config(
     page_title = 'Random Password Generator',
     layout = "wide"
 )
-st.caption('Created by Will Huang.')
+st.caption(f'Created by Will Huang. Version {VERSION}.')
 st.title('Random Password Generator')
 st.subheader('Randomly generate a password according to your criteria.')
 col1, col2, col3 = st.columns(3, gap = 'medium')
 
+# Bind the Streamlit widgets used below to names in this script,
+# so that calling them skips the attribute lookup on the module.
+radio = st.radio
+write = st.write
+text = st.text
+button = st.button
+number_input = st.number_input
+text_input = st.text_input
+
 # Create a password generator.
 @st.cache_resource
 def _get_generator():
     return PasswordGenerator()
 g = _get_generator()
 
+# Create the constants used by the interface. Streamlit reruns
+# this script on every interaction, so they are built only once.
+@st.cache_resource
+def _get_constants():
+    return SimpleNamespace(
+
+        # The options used by the PasswordGenerator class for whether
+        # a group of symbols should be included.
+        options = ('must', 'never', 'random'),
+
+        # The labels and keys of the radio buttons for the basic
+        # symbols. Each key is also the name of the PasswordGenerator
+        # property that the radio button sets.
+        basic_radios = (
+            ('**Include lower-case letters?**', 'include_lower_case'),
+            ('**Include upper-case letters?**', 'include_upper_case'),
+            ('**Include digits (from 0 to 9)?**', 'include_digits'),
+        ),
+
+        # A bitmask with one bit set for each of the four symbol groups.
+        all_groups = 0b1111,
+
+        # A map from the options used by the PasswordGenerator
+        # class to their human-readable labels. The radio buttons
+        # below store the options themselves and only display the labels.
+        labels = {
+            'must': "Must include",
+            'never': "Never include",
+            'random': "Decide randomly",
+        },
+
+        # The messages shown when custom special characters do not
+        # meet the requirements, keyed by validation status code.
+        custom_messages = {
+            DUPLICATED: ':red[There are repeated custom characters. Please make sure '
+                        'they are all unique.]',
+            EMPTY: ':red[Special symbols must be provided.]',
+            ALPHANUMERIC: ':red[Special characters should not include English letters or '
+                          'digits.]',
+        },
+
+        # The options and captions of the radio buttons for where
+        # special characters come from.
+        special_sources = ("Default", "Custom"),
+        special_source_captions = (
+            f'Use the following characters:\n{punctuation}',
+            'Use your own custom list below.',
+        ),
+    )
+C = _get_constants()
+
+# Create a function to update a property of the generator only
+# when its value changes, which skips the checks in its setter on
+# reruns that leave the property unchanged.
+def _update(name: str, value):
+    if getattr(g, name) != value:
+        setattr(g, name, value)
+
 # ===== ===== ===== ===== ===== ===== ===== =====
 # Password Options
 # ===== ===== ===== ===== ===== ===== ===== =====
 
-# Create a map to translate the human-readable options to
-# their equivalent in the PasswordGenerator class.
-mapping = {
-    "Must include": 'must',
-    "Never include": 'never',
-    "Decide randomly": 'random'
-}
-
 # ----- ----- ----- ----- ----- ----- ----- -----
 # Set the basic symbols
 # ----- ----- ----- ----- ----- ----- ----- -----
@@ -50,7 +116,7 @@ mapping = {
 with col1:
 
     # Create a field for entering the password length.
-    g.length = st.number_input(
+    _update('length', number_input(
         label = '**Password Length**',
         min_value = 1,
         value = 12,
@@ -58,29 +124,17 @@ with col1:
         format = '%d',
         key = 'length',
         label_visibility = "visible"
-    )
+    ))
 
     # Create radio buttons for which symbols should be included.
-    include_lower = st.radio(
-        label = '**Include lower-case letters?**',
-        key = 'include_lower_case',
-        options = ["Must include", "Never include", "Decide randomly"],
-    )
-    g.include_lower_case = mapping[include_lower]
-
-    include_upper = st.radio(
-        label = '**Include upper-case letters?**',
-        key = 'include_upper_case',
-        options = ["Must include", "Never include", "Decide randomly"],
-    )
-    g.include_upper_case = mapping[include_upper]
-
-    include_digits = st.radio(
-        label = '**Include digits (from 0 to 9)?**',
-        key = 'include_digits',
-        options = ["Must include", "Never include", "Decide randomly"],
-    )
-    g.include_digits = mapping[include_digits]
+    # Each radio button sets the generator property named by its key.
+    for label, key in C.basic_radios:
+        _update(key, radio(
+            label = label,
+            key = key,
+            options = C.options,
+            format_func = C.labels.get,
+        ))
 
 # ----- ----- ----- ----- ----- ----- ----- -----
 # Set the special characters
@@ -89,31 +143,29 @@ with col1:
 with col2:
 
     # Create a button for whether special characters should be included.
-    include_special = st.radio(
+    include_special = radio(
         label = '**Include special characters?**',
         key = 'include_special_characters',
-        options = ["Must include", "Never include", "Decide randomly"],
+        options = C.options,
+        format_func = C.labels.get,
         help = 'This option determines whether special characters other than '
                'English letters and digits should be included in the password.',
         index = 2,
     )
 
     # Update the generator.
-    g.include_special_characters = mapping[include_special]
+    _update('include_special_characters', include_special)
 
     # Create radio buttons for deciding whether to use custom characters.
-    special_source = st.radio(
+    special_source = radio(
         label = '**If special characters are used, which ones are they allowed to be?**',
         key = 'special_character_range',
-        options = ["Default", "Custom"],
-        captions = [
-            f'Use the following characters:\n{punctuation}',
-            'Use your own custom list below.'
-        ],
+        options = C.special_sources,
+        captions = C.special_source_captions,
     )
 
     # Create a field for entering customized special characters.
-    custom_characters = st.text_input(
+    custom_characters = text_input(
         label = 'Custom Special Characters',
         key = 'custom_special_characters',
         value = '',
@@ -127,34 +179,27 @@ with col2:
 
     # If default special characters are used, set them in the generator.
     if special_source == "Default":
-        g.special_characters = punctuation
+        _update('special_characters', punctuation)
+        pass_special_character = True
+
+    # If special characters are never used, or if no custom character
+    # is provided while none is required, there is nothing to check.
+    elif (
+        (g.include_special_characters == 'never') or
+        (len(custom_characters) == 0 and g.include_special_characters != 'must')
+    ):
+        _update('special_characters', '')
         pass_special_character = True
 
     # If custom characters are used, check if they meet the requirements.
+    # Empty custom characters only get here when they are required.
     else:
-
-        # Check if there are repeated symbols.
-        counts = [custom_characters.count(x) for x in set(custom_characters)]
-        if any(count > 1 for count in counts):
-            st.write(':red[There are repeated custom characters. Please make sure '
-                     'they are all unique.]')
-
-        # Check if special characters are provided when required.
-        elif (g.include_special_characters == 'must') and len(custom_characters) == 0:
-            st.write(
-                ':red[Special symbols must be provided.]'
-            )
-
-        # Make sure special characters do not include English letters or digits.
-        elif set(custom_characters).intersection(
-            [*ascii_lowercase, *ascii_uppercase, *digits]
-        ):
-            st.write(':red[Special characters should not include English letters or '
-                     'digits.]')
-
-        else:
+        status = validate_custom_characters(custom_characters)
+        if status == VALID:
             pass_special_character = True
-            g.special_characters = custom_characters
+            _update('special_characters', custom_characters)
+        else:
+            write(C.custom_messages[status])
 
 # ----- ----- ----- ----- ----- ----- ----- -----
 # Generate password
@@ -163,35 +208,70 @@ with col2:
 with col3:
 
     # Create a button for generating password.
-    generate = st.button(
+    generate = button(
         label = 'Generate Password',
         key = 'generate_password',
         type = 'primary',
     )
 
+    # Keep showing the last password unless the button was clicked
+    # and a new password could not be generated.
+    show_password = not generate
+
+    # Pack which symbol groups must or must never be included
+    # into bitmasks, one bit per group. The four groups are fixed,
+    # so the bits are set in straight-line code rather than a loop.
+    upper, lower, digit, special = (
+        g.include_upper_case,
+        g.include_lower_case,
+        g.include_digits,
+        g.include_special_characters,
+    )
+    musts = (
+        (upper == 'must') | (lower == 'must') << 1 |
+        (digit == 'must') << 2 | (special == 'must') << 3
+    )
+    # Special characters can never be included if none is provided.
+    nevers = (
+        (upper == 'never') | (lower == 'never') << 1 |
+        (digit == 'never') << 2 |
+        ((special == 'never') or (len(g.special_characters) == 0)) << 3
+    )
+
     # Check if at least some symbols are allowed.
-    if all([
-        g.include_upper_case == 'never',
-        g.include_lower_case == 'never',
-        g.include_digits == 'never',
-        g.include_special_characters == 'never',
-    ]):
-        st.write('Please change the setting to allow symbols to be included in the password.')
+    if nevers == C.all_groups:
+        write('Please change the setting to allow symbols to be included in the password.')
 
     elif generate:
 
         # Check if length is shorter than the required number of symbols.
-        n_must = sum([
-            g.include_upper_case == 'must',
-            g.include_lower_case == 'must',
-            g.include_digits == 'must',
-            g.include_special_characters == 'must',
-        ])
+        n_must = musts.bit_count()
         if g.length < n_must:
-            st.write(f'The length ({g.length}) is shorter than the minimum number of symbols that '
-                     f'must show up ({n_must}).')
+            write(f'The length ({g.length}) is shorter than the minimum number of symbols that '
+                  f'must show up ({n_must}).')
         elif pass_special_character:
-            st.text(g.generate())
+
+            # Generate a password from a snapshot of the settings, as the
+            # generator is shared with other sessions, and keep it in this
+            # session only, so that it is gone when the session ends. The
+            # password is drawn from the operating system's randomness, as
+            # all sessions share this process.
+            st.session_state['password'] = PasswordGenerator(
+                g.length,
+                g.include_lower_case,
+                g.include_upper_case,
+                g.include_digits,
+                g.include_special_characters,
+                g.special_characters,
+                secure = True,
+            ).generate()
+            show_password = True
+
         elif not pass_special_character:
-            st.write(':red[Please resolve the issues with special character '
-                     'settings and try again.]')
+            write(':red[Please resolve the issues with special character '
+                  'settings and try again.]')
+
+    # Show the last generated password. Reruns caused by other widgets
+    # show the same password instead of generating a new one.
+    if show_password and ('password' in st.session_state):
+        text(st.session_state['password'])
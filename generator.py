@@ -5,14 +5,441 @@
 
 # Dependency versions
 # Python == 3.10.10
+# numpy (optional)
 
 # Imports
+import os
 import random
+from collections import Counter
+from functools import lru_cache
 from string import ascii_lowercase, ascii_uppercase, digits, punctuation
 
+# NumPy is optional. When it is installed, long passwords
+# are drawn with vectorized operations.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The minimum password length for which NumPy is used to shuffle
+# ASCII symbols. Shorter passwords are faster to shuffle in pure Python.
+_NUMPY_MIN_LENGTH = 64
+
+# The minimum password length for which NumPy is used to draw and
+# shuffle symbols outside of ASCII. Drawing them from random bytes in
+# pure Python is faster up to about this length.
+_NUMPY_MIN_LENGTH_NON_ASCII = 150
+
+# The random generators shared by the instances of PasswordGenerator
+# that are not given a seed, so that creating an instance does not
+# allocate and seed a new Mersenne Twister state. The shared
+# random.Random is predictable from enough of its outputs, so it is
+# unsuitable when several users share one process, e.g. a web server;
+# use secure = True there.
+_SHARED_RANDOM = random.Random()
+_SHARED_SYSTEM_RANDOM = random.SystemRandom()
+
+# Reseed the shared random.Random in forked child processes, as the
+# random module does for its own generator, so that the workers of a
+# pre-fork server do not generate the same passwords.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child = _SHARED_RANDOM.seed)
+
+# Status codes returned by validate_custom_characters.
+VALID = 0
+DUPLICATED = 1
+EMPTY = 2
+ALPHANUMERIC = 3
+
+# The options for whether a group of symbols should be
+# included in the password.
+_MODES = frozenset({'must', 'never', 'random'})
+
+# All symbols in the default settings.
+_ALL_DEFAULT = ascii_lowercase + ascii_uppercase + digits + punctuation
+
+# The symbols other than special characters.
+_DEFAULT_SYMBOLS = frozenset(ascii_uppercase + ascii_lowercase + digits)
+
+# The sets of symbols in each basic group, which are used to verify
+# generated passwords. The set of special characters is built per instance.
+_LOWER_SET = frozenset(ascii_lowercase)
+_UPPER_SET = frozenset(ascii_uppercase)
+_DIGIT_SET = frozenset(digits)
+
+# A 256-entry table mapping each ASCII letter and digit to the bit of its
+# group (1, 2 and 4), and special characters to 8 per instance. Translating
+# an ASCII password with the table and searching for each bit checks all
+# groups in C.
+_BASE_GROUP_TABLE = bytes(
+    1 if chr(i) in _LOWER_SET else
+    2 if chr(i) in _UPPER_SET else
+    4 if chr(i) in _DIGIT_SET else 0
+    for i in range(256)
+)
+
+# A translation table deleting English letters and digits.
+_DEL_ALNUM = str.maketrans('', '', ascii_lowercase + ascii_uppercase + digits)
+
+# Functions
+@lru_cache(maxsize = 128)
+def validate_custom_characters(x: str) -> int:
+
+    """
+    Check if a string of custom special characters can be used as
+    special_characters. The result is cached for recent inputs.
+
+    Parameters
+    ----------
+    x: str
+        The custom special characters to check.
+
+    Returns
+    -------
+    An integer status code, checked in the following order:
+    - DUPLICATED (1): Some symbols appear more than once.
+    - EMPTY (2): No symbol is provided.
+    - ALPHANUMERIC (3): Some symbols are English letters or digits.
+    - VALID (0): None of the above.
+    """
+
+    if len(x) != len(set(x)):
+        return DUPLICATED
+    if len(x) == 0:
+        return EMPTY
+    if len(x.translate(_DEL_ALNUM)) != len(x):
+        return ALPHANUMERIC
+    return VALID
+
+def _check_mode(name: str, x):
+
+    """
+    Check if x is one of the options in _MODES, and raise a ValueError
+    mentioning the property name otherwise.
+    """
+
+    if not (isinstance(x, str) and x in _MODES):
+        raise ValueError(
+            f'{name} should be "must", "never" or "random" '
+            f'instead of "{x}".'
+        )
+
+@lru_cache(maxsize = 128)
+def _special_character_tables(x: str) -> tuple:
+
+    """
+    Check if a string can be used as special_characters with the rules
+    of validate_custom_characters, except that an empty string is allowed,
+    and raise a ValueError otherwise. The result is cached for recent
+    inputs, so each string is checked only once.
+
+    Parameters
+    ----------
+    x: str
+        The special characters to check.
+
+    Returns
+    -------
+    A tuple (special_set, group_table) of the frozenset of the symbols
+    and the 256-entry byte table used to verify passwords, which is
+    None if some symbols are outside of ASCII.
+    """
+
+    # Apply the same rules as validate_custom_characters, except that
+    # an empty string is allowed. The offending symbols
+    # are only listed when raising an error.
+    status = validate_custom_characters(x)
+
+    # Prevent the user from submitting duplicated special characters.
+    if status == DUPLICATED:
+        duplicates = {s: c for s, c in Counter(x).items() if c > 1}
+        raise ValueError(
+            f'The string submitted to special_characters contains '
+            f'duplicated symbols. Here are the duplicated symbols and '
+            f'how many times they appear:\n{duplicates}.'
+        )
+
+    # Prevent the user from duplicating the default symbols.
+    if status == ALPHANUMERIC:
+        common = set(x) & _DEFAULT_SYMBOLS
+        raise ValueError(
+            f'special_characters should not include the following '
+            f'symbols: {common}.'
+        )
+
+    # Build the set of symbols and, if they are all ASCII, the
+    # byte table mapping them to the bit of their group.
+    if x.isascii():
+        group_table = bytearray(_BASE_GROUP_TABLE)
+        for symbol in x.encode('ascii'):
+            group_table[symbol] = 8
+        group_table = bytes(group_table)
+    else:
+        group_table = None
+
+    return frozenset(x), group_table
+
+# Check the default special characters once when the module is imported.
+_special_character_tables(punctuation)
+
+def _verify_inclusion(pw: str, present: bool, reference_name: str, mode: str):
+
+    """
+    Check if a generated password includes or excludes a group of symbols.
+
+    Parameters
+    ----------
+    pw: str
+        The generated password.
+
+    present: bool
+        Whether any symbol of the group is present in the password.
+
+    reference_name: str
+        The name of the group of symbols used in error messages.
+
+    mode: str
+        Whether the group of symbols should be included ('must'),
+        excluded ('never') or either ('random').
+    """
+
+    if (mode == 'must') and (not present):
+        raise ValueError(
+            f'The generated password\n{pw}\ndoes not '
+            f'include {reference_name} when it should. '
+            f'Please fix the code.'
+        )
+
+    elif (mode == 'never') and present:
+        raise ValueError(
+            f'The generated password\n{pw}\nincludes '
+            f'{reference_name} when it should not. '
+            f'Please fix the code.'
+        )
+
+@lru_cache(maxsize = 32)
+def _byte_tables(symbols: str):
+
+    """
+    Create the tables used by _draw_from_bytes to map random bytes
+    to symbols. The tables are cached for recent symbol strings.
+
+    Parameters
+    ----------
+    symbols: str
+        The symbols to draw from.
+
+    Returns
+    -------
+    None if the symbols cannot be drawn from bytes, i.e., if there is
+    no symbol, more than 256 symbols or a symbol outside of ASCII.
+    Otherwise, a tuple (table, delete) for bytes.translate, where table
+    maps each byte to a symbol and delete contains the largest bytes,
+    which would make some symbols more likely than others.
+    """
+
+    n = len(symbols)
+    if (n == 0) or (n > 256) or (not symbols.isascii()):
+        return None
+
+    limit = 256 - 256 % n
+    table = bytes(ord(symbols[b % n]) if b < limit else 0 for b in range(256))
+    delete = bytes(range(limit, 256))
+    return table, delete
+
+def _draw_from_bytes(generator: random.Random, table: bytes, delete: bytes, k: int) -> bytes:
+
+    """
+    Draw a random sample (with replacement) of k symbols by mapping
+    random bytes from randbytes to symbols with bytes.translate, which
+    handles every byte in C instead of one symbol at a time in Python.
+    For random.Random, randbytes gives the same bytes as getrandbits,
+    and for random.SystemRandom, it reads them from os.urandom directly.
+
+    Parameters
+    ----------
+    generator: random.Random
+        The random generator used to draw the bytes.
+
+    table, delete: bytes
+        The tables created by _byte_tables for the symbols to draw.
+
+    k: int
+        The number of symbols to draw.
+
+    Returns
+    -------
+    The drawn symbols as ASCII bytes.
+    """
+
+    # Keep track of how many symbols are still missing, which is
+    # only recounted after each draw.
+    sample = b''
+    n_missing = k
+    while n_missing > 0:
+
+        # Draw enough bytes to cover the deleted ones on average.
+        n_bytes = n_missing * 256 // (256 - len(delete)) + 1
+        sample += generator.randbytes(n_bytes).translate(table, delete)
+        n_missing = k - len(sample)
+
+    # Drop the extra symbols if too few bytes were deleted.
+    return sample if n_missing == 0 else sample[:k]
+
+@lru_cache(maxsize = 32)
+def _index_tables(symbols: str):
+
+    """
+    Create the tables used by _draw_symbols to draw symbols outside of
+    ASCII from random bytes. The tables are cached for recent symbol
+    strings.
+
+    Parameters
+    ----------
+    symbols: str
+        The symbols to draw from.
+
+    Returns
+    -------
+    None if the symbols cannot be drawn this way, i.e., if there is no
+    symbol or more than 128 symbols. Otherwise, a tuple (table, delete,
+    mapping), where table and delete are the tables from _byte_tables
+    mapping random bytes to the positions of the symbols, as ASCII
+    characters, and mapping translates each position into its symbol.
+    """
+
+    n = len(symbols)
+    if (n == 0) or (n > 128):
+        return None
+
+    table, delete = _byte_tables(''.join(map(chr, range(n))))
+    return table, delete, dict(enumerate(symbols))
+
+def _draw_symbols(generator: random.Random, symbols: str, k: int) -> str:
+
+    """
+    Draw a random sample (with replacement) of k symbols that may be
+    outside of ASCII. The positions of the symbols are drawn from
+    random bytes, then replaced by the symbols with str.translate,
+    so that no string is created for each symbol. If there are too
+    many symbols to draw positions from bytes, use generator.choices.
+
+    Parameters
+    ----------
+    generator: random.Random
+        The random generator used to draw the symbols.
+
+    symbols: str
+        The symbols to draw from.
+
+    k: int
+        The number of symbols to draw.
+
+    Returns
+    -------
+    The drawn symbols as a string.
+    """
+
+    index_tables = _index_tables(symbols)
+    if index_tables is None:
+        return ''.join(generator.choices(symbols, k = k))
+
+    table, delete, mapping = index_tables
+    return _draw_from_bytes(generator, table, delete, k).decode('ascii').translate(mapping)
+
+def _shuffle_bytes(generator: random.Random, buffer: bytearray):
+
+    """
+    Randomly shuffle a buffer of bytes in-place. Long buffers are
+    shuffled with NumPy if it is installed, whose random generator
+    is seeded from the given one, unless the given one is a
+    random.SystemRandom, as NumPy's generator is not suitable
+    for cryptographic use.
+
+    Parameters
+    ----------
+    generator: random.Random
+        The random generator used to shuffle the buffer.
+
+    buffer: bytearray
+        The bytes to shuffle.
+    """
+
+    if (
+        (np is not None) and
+        (len(buffer) >= _NUMPY_MIN_LENGTH) and
+        (not isinstance(generator, random.SystemRandom))
+    ):
+        np_rng = np.random.default_rng(generator.getrandbits(128))
+        np_rng.shuffle(np.frombuffer(buffer, dtype = np.uint8))
+    else:
+        generator.shuffle(buffer)
+
+def _numpy_sample(plan: list, rng) -> str:
+
+    """
+    Draw the symbols of a password with NumPy and shuffle them.
+    All symbols are drawn in a single vectorized call.
+
+    Parameters
+    ----------
+    plan: list
+        Pairs of a string of symbols and how many symbols to draw
+        from it (with replacement).
+
+    rng: numpy.random.Generator
+        The random generator used to draw and shuffle the symbols.
+
+    Returns
+    -------
+    A string containing the drawn symbols in random order.
+    """
+
+    # Concatenate the code points of all symbol groups into a flat
+    # alphabet and find where each group starts in it. Code points
+    # are used because custom special characters may not be ASCII.
+    alphabet = np.frombuffer(
+        ''.join(symbols for symbols, _ in plan).encode('utf-32-le'),
+        dtype = np.uint32
+    )
+    sizes = np.array([len(symbols) for symbols, _ in plan], dtype = np.int64)
+    counts = np.array([k for _, k in plan], dtype = np.int64)
+    offsets = np.cumsum(sizes) - sizes
+
+    # Draw the position of every symbol within its group at once,
+    # then shift it to the group's position in the alphabet.
+    groups = np.repeat(np.arange(len(plan)), counts)
+    codes = alphabet[offsets[groups] + rng.integers(0, sizes[groups])]
+
+    # Randomly shuffle the order of the symbols in-place.
+    rng.shuffle(codes)
+
+    return codes.tobytes().decode('utf-32-le')
+
 # Classes
 class PasswordGenerator:
 
+    # Store the properties in slots instead of an instance dictionary,
+    # which makes them smaller and faster to access. Private names are
+    # mangled by Python, so they are listed as written in the class.
+    __slots__ = (
+
+        # The properties.
+        '__generator',
+        '__special_characters',
+        '__length',
+        '__include_lower_case',
+        '__include_upper_case',
+        '__include_digits',
+        '__include_special_characters',
+
+        # The values derived from the properties, which are
+        # updated or cleared by their setters.
+        '__special_set',
+        '__group_table',
+        '__groups_cache',
+    )
+
     def __init__(
         self,
         length = 10,
@@ -21,6 +448,8 @@ class PasswordGenerator:
         include_digits = 'must',
         include_special_characters = 'random',
         custom_special_characters = None,
+        secure = False,
+        seed = None,
     ):
 
         f"""
@@ -52,6 +481,24 @@ class PasswordGenerator:
             If the user prefers to use special symbols that are different from
             the default ASCII punctuation symbols, then pass a string containing
             these symbols.
+
+        secure: bool
+            If True, then draw passwords with random.SystemRandom, which reads
+            random bytes from the operating system (os.urandom) and is suitable
+            for cryptographic use. Otherwise, use random.Random, whose passwords
+            can be reproduced by seeding it. Use True whenever passwords for
+            several users are generated in one process, e.g. a web server.
+
+        seed: None, int, float, str, bytes or bytearray
+            If given, then draw passwords with a new random.Random seeded
+            with it, so that they can be reproduced. Otherwise, draw them
+            with a random generator shared by all instances, so seeding
+            the generator property of one instance affects the others, and
+            the passwords of one instance can be predicted from enough
+            passwords of the others; see secure above. The shared generator
+            is reseeded in child processes created by os.fork, whereas a
+            seeded generator gives the same passwords in every process.
+            This cannot be used together with secure = True.
         """
 
         # Set the scope for all special characters.
@@ -60,8 +507,18 @@ class PasswordGenerator:
         else:
             self.special_characters = custom_special_characters
 
+        # Set the random generator.
+        if seed is not None:
+            if secure:
+                raise ValueError('seed cannot be used when secure is True, '
+                                 'as random.SystemRandom cannot be seeded.')
+            self.generator = random.Random(seed)
+        elif secure:
+            self.generator = _SHARED_SYSTEM_RANDOM
+        else:
+            self.generator = _SHARED_RANDOM
+
         # Set other properties.
-        self.generator = random.Random()
         self.length = length
         self.include_lower_case = include_lower_case
         self.include_upper_case = include_upper_case
@@ -156,28 +613,16 @@ class PasswordGenerator:
         # if len(x) == 0:
         #     raise ValueError(f'There is no special character provided.')
 
-        # Prevent the user from duplicating the default symbols.
-        x_set = set(x)
-        default_symbols = set(ascii_uppercase + ascii_lowercase + digits)
-        common = x_set.intersection(default_symbols)
-        if len(common) > 0:
-            raise ValueError(
-                f'special_characters should not include the following '
-                f'symbols: {common}.'
-            )
-
-        # Prevent the user from submitting duplicated special characters.
-        counts = {symbol: x.count(symbol) for symbol in x_set}
-        duplicates = {s: c for s, c in counts.items() if c > 1}
-        if duplicates:
-            raise ValueError(
-                f'The string submitted to special_characters contains '
-                f'duplicated symbols. Here are the duplicated symbols and '
-                f'how many times they appear:\n{duplicates}.'
-            )
-
+        # Check the symbols and build the tables used to verify
+        # passwords. Both are cached, so the default and recently
+        # used special characters are not checked again.
+        self.__special_set, self.__group_table = _special_character_tables(x)
         self.__special_characters = x
 
+        # Clear the groups of symbols to draw from, which are
+        # rebuilt from the new settings when they are next used.
+        self.__groups_cache = None
+
     @length.setter
     def length(self, x):
         if not isinstance(x, int):
@@ -188,39 +633,27 @@ class PasswordGenerator:
 
     @include_lower_case.setter
     def include_lower_case(self, x):
-        if x not in ['must', 'never', 'random']:
-            raise ValueError(
-                f'include_lower_case should be "must", "never" or "random" '
-                f'instead of "{x}".'
-            )
+        _check_mode('include_lower_case', x)
         self.__include_lower_case = x
+        self.__groups_cache = None
 
     @include_upper_case.setter
     def include_upper_case(self, x):
-        if x not in ['must', 'never', 'random']:
-            raise ValueError(
-                f'include_upper_case should be "must", "never" or "random" '
-                f'instead of "{x}".'
-            )
+        _check_mode('include_upper_case', x)
         self.__include_upper_case = x
+        self.__groups_cache = None
 
     @include_digits.setter
     def include_digits(self, x):
-        if x not in ['must', 'never', 'random']:
-            raise ValueError(
-                f'include_digits should be "must", "never" '
-                f'or "random instead of "{x}".'
-            )
+        _check_mode('include_digits', x)
         self.__include_digits = x
+        self.__groups_cache = None
 
     @include_special_characters.setter
     def include_special_characters(self, x):
-        if x not in ['must', 'never', 'random']:
-            raise ValueError(
-                f'include_special_characters should be "must", "never" '
-                f'or "random instead of "{x}".'
-            )
+        _check_mode('include_special_characters', x)
         self.__include_special_characters = x
+        self.__groups_cache = None
 
     @property
     def settings(self):
@@ -228,160 +661,266 @@ class PasswordGenerator:
         """View the settings for this random password generator."""
 
         return {
-            'Lower Case': {
-                'Symbols': ascii_lowercase,
-                'Include': self.include_lower_case,
-            },
-            'Upper Case': {
-                'Symbols': ascii_uppercase,
-                'Include': self.include_upper_case,
-            },
-            'Digits': {
-                'Symbols': digits,
-                'Include': self.include_digits,
-            },
-            'Special Characters': {
-                'Symbols': self.special_characters,
-                'Include': self.include_special_characters,
-            },
+            name: {'Symbols': symbols, 'Include': include}
+            for name, symbols, include in self._groups()
         }
 
+    def _groups(self) -> tuple:
+
+        """
+        Get the settings for each group of symbols as a tuple of
+        (name, symbols, include) triples, in the same order as the
+        settings property but without building nested dictionaries.
+        """
+
+        return (
+            ('Lower Case', ascii_lowercase, self.__include_lower_case),
+            ('Upper Case', ascii_uppercase, self.__include_upper_case),
+            ('Digits', digits, self.__include_digits),
+            ('Special Characters', self.__special_characters,
+             self.__include_special_characters),
+        )
+
     # ===== ===== ===== ===== ===== ===== ===== =====
     # Methods
     # ===== ===== ===== ===== ===== ===== ===== =====
 
-    def generate(self, verify = True) -> 'str':
+    def _verify(self, password: str):
 
         """
-        Generate a random password.
-        The password is generated according to the following properties
-        of this class instance:
+        Check if a generated password complies with the length and with
+        whether each group of symbols should be included, and raise a
+        ValueError otherwise.
+        """
 
-        - length
-        - special_characters
-        - include_lower_case
-        - include_upper_case
-        - include_digits
-        - include_special_characters
+        # Check length.
+        if len(password) != self.length:
+            raise ValueError(
+                f'The length of the generated password\n{password}\n'
+                f'is {len(password)}, which is different from the '
+                f'required length of {self.length}.')
+
+        # Pack which groups must or must never be included into
+        # bitmasks, with one bit per group.
+        lower, upper, digit, special = (
+            self.include_lower_case,
+            self.include_upper_case,
+            self.include_digits,
+            self.include_special_characters,
+        )
+        musts = (
+            (lower == 'must') | (upper == 'must') << 1 |
+            (digit == 'must') << 2 | (special == 'must') << 3
+        )
+        nevers = (
+            (lower == 'never') | (upper == 'never') << 1 |
+            (digit == 'never') << 2 | (special == 'never') << 3
+        )
+
+        # Find which groups of symbols are present in the password as a
+        # bitmask of the same kind. For the groups that must be included,
+        # one symbol is enough, so the password is only scanned until
+        # the first one is found. Groups included randomly are skipped.
+        present = 0
+        for bit, reference in (
+            (1, _LOWER_SET),
+            (2, _UPPER_SET),
+            (4, _DIGIT_SET),
+            (8, self.__special_set),
+        ):
+            if (musts & bit) and (not reference.isdisjoint(password)):
+                present |= bit
+
+        # The groups that must never be included need a full scan.
+        if nevers:
+
+            # If all symbols are ASCII, map each one to the bit of its
+            # group with a byte table and search for each bit.
+            group_table = self.__group_table
+            if (group_table is not None) and password.isascii():
+                found = password.encode('ascii').translate(group_table)
+                found = (
+                    (b'\x01' in found) | (b'\x02' in found) << 1 |
+                    (b'\x04' in found) << 2 | (b'\x08' in found) << 3
+                )
 
-        For details, please refer to the documentation for these properties.
+            # Otherwise, collect the distinct symbols of the password in a
+            # single pass and check each group against this set, which is at
+            # most as large as the alphabet, instead of against the password.
+            else:
+                pw_set = set(password)
+                found = (
+                    (not pw_set.isdisjoint(_LOWER_SET)) |
+                    (not pw_set.isdisjoint(_UPPER_SET)) << 1 |
+                    (not pw_set.isdisjoint(_DIGIT_SET)) << 2 |
+                    (not pw_set.isdisjoint(self.__special_set)) << 3
+                )
+
+            present |= found & nevers
+
+        # Check the password against all groups at once.
+        if (musts & ~present) | (nevers & present) == 0:
+            return
+
+        # Find which group of symbols is wrong and raise an error for it.
+        for bit, reference_name, mode in (
+            (1, 'lower-case letters', lower),
+            (2, 'upper-case letters', upper),
+            (4, 'digits', digit),
+            (8, 'special characters', special),
+        ):
+            _verify_inclusion(
+                pw = password,
+                present = bool(present & bit),
+                reference_name = reference_name,
+                mode = mode
+            )
+
+    @staticmethod
+    def _get_variable_sample_size(rng: random.Random, max_n: int, mode: str) -> int:
+
+        """
+        This function randomly decides the size of a random sample
+        (with replacement) to draw from a symbol group.
 
         Parameters
         ----------
-        verify: bool
-            If True, then check if the generated password complies with
-            the requirements (properties) specified above.
+        rng: random.Random
+            The random generator used to decide the sample size.
+
+        max_n: int
+            The largest sample size allowed.
+            This should be at least 1. However, no sample will be
+            returned if mode = 'never' (see below).
+
+        mode: str
+            This determines how many samples would be drawn randomly.
+            The permitted inputs are the following:
+            - 'must': The sample size is at least 1.
+            - 'never': The sample size is always zero.
+            - 'random': The sample size is at least 0.
 
         Returns
         -------
-        A string containing the generated password.
+        The randomly-decided sample size.
         """
 
-        # ===== ===== ===== ===== ===== ===== ===== =====
-        # Create a function for drawing random samples
-        # with random length.
-        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Check inputs.
+        if not isinstance(max_n, int):
+            raise TypeError(f'max_n should be an integer instead of {type(max_n)}')
+        if max_n < 1:
+            raise ValueError(f'max_n should not be negative; it is currently {max_n}.')
 
-        def _get_variable_length_sample(
-            population, max_n: int, mode: str
-        ) -> tuple:
-
-            """
-            This function randomly decides a sample size, and then draw
-            a random sample (with replacement) whose size is the randomly-
-            decided sample size.
-
-            Parameters
-            ----------
-            population: iterable
-                The population from which to sample with replacement.
-
-            max_n: int
-                The largest sample size allowed.
-                This should be at least 1. However, no sample will be
-                returned if mode = 'never' (see below).
-
-            mode: str
-                This determines how many samples would be drawn randomly.
-                The permitted inputs are the following:
-                - 'must': The sample size is at least 1.
-                - 'never': The sample size is always zero.
-                - 'random': The sample size is at least 0.
-
-            Returns
-            -------
-            A list containing the random elements drawn from the population.
-            """
-
-            # Check inputs.
-            if not isinstance(max_n, int):
-                raise TypeError(f'max_n should be an integer instead of {type(max_n)}')
+        # Determine the sample size.
+        if mode == 'must':
             if max_n < 1:
-                raise ValueError(f'max_n should not be negative; it is currently {max_n}.')
-
-            # Determine the sample size.
-            if mode == 'must':
-                if max_n < 1:
-                    raise ValueError(f'When mode == "must", max_n should be at '
-                                     f'least 1 instead of {max_n}.')
-                k = self.generator.choice(range(1, max_n + 1))
-            elif mode == 'never':
-                k = 0
-            elif mode == 'random':
-                k = self.generator.choice(range(0, max_n + 1))
-            else:
-                raise ValueError(
-                    f'mode should be "must", "never" or "random" '
-                    f'instead of "{mode}".'
-                )
+                raise ValueError(f'When mode == "must", max_n should be at '
+                                 f'least 1 instead of {max_n}.')
+            k = rng.randint(1, max_n)
+        elif mode == 'never':
+            k = 0
+        elif mode == 'random':
+            k = rng.randint(0, max_n)
+        else:
+            raise ValueError(
+                f'mode should be "must", "never" or "random" '
+                f'instead of "{mode}".'
+            )
 
-            # Draw random sample from all possible symbols.
-            return self.generator.choices(population, k = k)
+        return k
 
-        # ===== ===== ===== ===== ===== ===== ===== =====
-        # Draw samples
-        # ===== ===== ===== ===== ===== ===== ===== =====
+    def _split_groups(self, length: int) -> tuple:
 
-        # Identify the symbols that must be included in the
-        # password as well as those that can be optional.
+        """
+        Split the groups of symbols into those that must be included
+        in a password and those that can be optional, as tuples of
+        (name, symbols, include) triples. Raise a ValueError if no
+        password of the given length can meet the settings.
+
+        The groups are built once and reused until a setter of the
+        include_* properties or special_characters changes them, along
+        with a dictionary mapping the symbols of each group (and of all
+        default symbols with the default settings) to their tables from
+        _byte_tables, whether all of the groups' tables exist and
+        whether the settings are the default ones, i.e., every group
+        must be included with the default special characters.
 
-        must_groups = {
-            key: value for key, value in self.settings.items()
-            if value['Include'] == 'must'
-        }
+        Returns
+        -------
+        A tuple (must_groups, optional_groups, draw_tables, all_bytes,
+        is_default).
+        """
 
-        optional_groups = {
-            key: value for key, value in self.settings.items()
-            if (
-                (value['Include'] == 'random') and
-                (len(value['Symbols']) > 0)
+        groups_cache = self.__groups_cache
+        if groups_cache is None:
+
+            # Identify the symbols that must be included in the
+            # password as well as those that can be optional.
+            # Build the settings only once for both groups.
+            groups = self._groups()
+
+            must_groups = tuple(
+                group for group in groups
+                if group[2] == 'must'
             )
-        }
 
-        # If special characters are included in must_groups,
-        # check if there is any symbol to sample from.
-        # This accounts for the possibility of customized
-        # special characters.
-        if (
-            ('Special Characters' in must_groups.keys()) and
-            (len(must_groups['Special Characters']['Symbols']) == 0)
-        ):
-            raise ValueError(
-                f'Special symbols should be included in the password, '
-                f'and yet there is no special symbol defined. '
-                f'Please change the settings by either providing '
-                f'special characters or not forcing them to be '
-                f'in the password.'
+            optional_groups = tuple(
+                group for group in groups
+                if (group[2] == 'random') and (len(group[1]) > 0)
             )
 
+            # If special characters must be included, check if there is
+            # any symbol to sample from. This accounts for the possibility
+            # of customized special characters. The settings are read from
+            # the groups built above rather than the properties.
+            _, special_symbols, special_mode = groups[3]
+            if (special_mode == 'must') and (len(special_symbols) == 0):
+                raise ValueError(
+                    f'Special symbols should be included in the password, '
+                    f'and yet there is no special symbol defined. '
+                    f'Please change the settings by either providing '
+                    f'special characters or not forcing them to be '
+                    f'in the password.'
+                )
 
-        # For the symbols that must be included, see if the
-        # specified length is enough to contain them.
-        if (len(must_groups) > 0) and (self.length < len(must_groups)):
+            # Check if there is any group of symbols to draw from, so that
+            # a password is never shorter than its length.
+            if (len(must_groups) == 0) and (len(optional_groups) == 0):
+                raise ValueError(
+                    f'There is no symbol that can be included in the password. '
+                    f'Please change the settings to allow at least one group '
+                    f'of symbols in the password.'
+                )
+
+            # Look up the tables for drawing each group from random bytes.
+            draw_tables = {
+                symbols: _byte_tables(symbols)
+                for _, symbols, _ in must_groups + optional_groups
+            }
+            all_bytes = None not in draw_tables.values()
+
+            # Check if the settings are the default ones. If so, also
+            # look up the tables for drawing from all default symbols.
+            is_default = (len(must_groups) == 4) and (special_symbols == punctuation)
+            if is_default:
+                draw_tables[_ALL_DEFAULT] = _byte_tables(_ALL_DEFAULT)
+
+            groups_cache = self.__groups_cache = (
+                must_groups, optional_groups, draw_tables, all_bytes, is_default
+            )
+
+        must_groups = groups_cache[0]
 
-            # Create a wording for which symbol groups are
-            # required to be in the password.
-            musts_wording = [each.lower() for each in must_groups]
+        # For the symbols that must be included, see if the
+        # specified length is enough to contain them. Only the
+        # count is needed unless the check fails. The length is
+        # positive, so this also means some groups are required.
+        n_must_groups = len(must_groups)
+        if length < n_must_groups:
+
+            # Create a wording for which symbol groups are required
+            # to be in the password, only when raising the error.
+            musts_wording = [name.lower() for name, _, _ in must_groups]
             if len(musts_wording) == 1:
                 musts_wording = musts_wording[0]
             else:
@@ -389,28 +928,51 @@ class PasswordGenerator:
                                 ' and ' + musts_wording[-1]
 
             raise ValueError(
-                f'There are {len(must_groups)} types of symbols ({musts_wording}) '
+                f'There are {n_must_groups} types of symbols ({musts_wording}) '
                 f'that should be included in the password, but the length of the '
-                f'password to generate is only {self.length}, which is not enough. '
+                f'password to generate is only {length}, which is not enough. '
                 f'Please change the password requirements.'
             )
 
-        # ===== ===== ===== ===== ===== ===== ===== =====
-        # Generate a password.
-        # ===== ===== ===== ===== ===== ===== ===== =====
+        return groups_cache
 
-        password = []
-        n_remaining = self.length
+    def _plan(
+        self,
+        rng: random.Random,
+        length: int,
+        must_groups: tuple,
+        optional_groups: tuple,
+    ) -> list:
 
-        # Draw samples from symbol groups that must be in the password.
-        while len(must_groups) > 0:
+        """
+        Plan how many symbols to draw from each group of symbols for
+        a single password.
 
-            # Get the settings for this group..
-            group_name, sub_settings = must_groups.popitem()
+        Returns
+        -------
+        A list of pairs of the group's symbols and the sample size,
+        which add up to the length.
+        """
+
+        plan = []
+        n_remaining = length
+        n_must_groups = len(must_groups)
+        n_optional_groups = len(optional_groups)
+
+        # Bind the methods used in the loops below to local names,
+        # which skips looking them up on every iteration.
+        append = plan.append
+        get_sample_size = self._get_variable_sample_size
+
+        # Draw samples from symbol groups that must be in the password.
+        # The groups are visited from the last one to the first one,
+        # so the groups still to visit are the ones before index i.
+        for i in range(n_must_groups - 1, -1, -1):
+            _, symbols, mode = must_groups[i]
 
             # Count the minimum number of symbols that should be
             # reserved for other symbol groups that must show up.
-            n_reserved_groups = len(must_groups)
+            n_reserved_groups = i
 
             # If the remaining available space is smaller than the
             # number of symbols that should be reserved, raise an error.
@@ -422,139 +984,360 @@ class PasswordGenerator:
                     f'available is {n_remaining}, which is supposed to be larger.'
                 )
 
-            # Draw random sample.
-            if (n_reserved_groups == 0) and (len(optional_groups) == 0):
+            # Decide the sample size.
+            if (n_reserved_groups == 0) and (n_optional_groups == 0):
 
                 # If there's no other symbol group to draw from, then
                 # the current symbol group in this loop must fill out
-                # the remaining space, so draw a random sample (with
-                # replacement) to fill it.
-                sub_sample = self.generator.choices(
-                    population = sub_settings['Symbols'],
-                    k = n_remaining
-                )
+                # the remaining space.
+                k = n_remaining
 
             else:
 
-                # Otherwise, draw a sample with variable length,
-                # but reserve enough space for the other essential
-                # symbol groups.
-                sub_sample = _get_variable_length_sample(
-                    population = sub_settings['Symbols'],
+                # Otherwise, decide a variable sample size, but reserve
+                # enough space for the other essential symbol groups.
+                k = get_sample_size(
+                    rng = rng,
                     max_n = n_remaining - n_reserved_groups,
-                    mode = sub_settings['Include']
+                    mode = mode
                 )
 
-            # Include the sub-sample in the overall password.
-            password.extend(sub_sample)
+            # Include the sample size in the plan.
+            append((symbols, k))
 
             # Update n_remaining.
-            n_remaining = self.length - len(password)
+            n_remaining -= k
 
         # Draw samples from symbol groups that may or may not be in the password.
-        while (n_remaining > 0) and (len(optional_groups) > 0):
+        # The groups are visited from the last one to the first one, so the
+        # group at index 0 is the last one to draw from.
+        for i in range(n_optional_groups - 1, -1, -1):
+            _, symbols, mode = optional_groups[i]
 
-            # Get the settings for this group.
-            group_name, sub_settings = optional_groups.popitem()
+            # Stop if there is no remaining space.
+            if n_remaining == 0:
+                break
 
-            # Draw random sample.
-            if len(optional_groups) == 0:
+            # Decide the sample size.
+            if i == 0:
 
                 # If there's no other symbol group to draw from, then
                 # the current symbol group in this loop must fill out
-                # the remaining space, so draw a random sample (with
-                # replacement) to fill it.
-                sub_sample = self.generator.choices(
-                    population = sub_settings['Symbols'],
-                    k = n_remaining
-                )
+                # the remaining space.
+                k = n_remaining
 
             else:
 
-                # Otherwise, draw a sample with variable length.
-                sub_sample = _get_variable_length_sample(
-                    population = sub_settings['Symbols'],
+                # Otherwise, decide a variable sample size.
+                k = get_sample_size(
+                    rng = rng,
                     max_n = n_remaining,
-                    mode = sub_settings['Include']
+                    mode = mode
                 )
 
-            # Include the sub-sample in the overall password.
-            password.extend(sub_sample)
+            # Include the sample size in the plan.
+            append((symbols, k))
 
             # Update n_remaining.
-            n_remaining = self.length - len(password)
+            n_remaining -= k
+
+        return plan
+
+    def generate(self, verify = False) -> 'str':
+
+        """
+        Generate a random password.
+        The password is generated according to the following properties
+        of this class instance:
+
+        - length
+        - special_characters
+        - include_lower_case
+        - include_upper_case
+        - include_digits
+        - include_special_characters
+
+        For details, please refer to the documentation for these properties.
+
+        Parameters
+        ----------
+        verify: bool
+            If True, then check if the generated password complies with
+            the requirements (properties) specified above. The password
+            complies with them by construction, so this is meant for
+            testing. The check is skipped when Python runs with -O.
+
+        Returns
+        -------
+        A string containing the generated password.
+        """
+
+        # Read the random generator and the length once, as the
+        # properties are used throughout.
+        rng = self.generator
+        length = self.length
+
+        # Identify the groups of symbols to draw from, checking
+        # that the settings allow a password to be generated.
+        (
+            must_groups, optional_groups, draw_tables, all_bytes, is_default
+        ) = self._split_groups(length)
+
+        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Take a shortcut for the default settings
+        # ===== ===== ===== ===== ===== ===== ===== =====
+
+        # When every group of symbols must be included with the default
+        # special characters, draw one symbol from each group and the
+        # rest from all of them, skipping the planning below. The length
+        # is at least 4 here, as the check above passed.
+        if is_default:
+
+            password = bytearray()
+            for symbols in (ascii_lowercase, ascii_uppercase, digits, punctuation):
+                password += _draw_from_bytes(rng, *draw_tables[symbols], 1)
+            password += _draw_from_bytes(
+                rng, *draw_tables[_ALL_DEFAULT], length - 4
+            )
+
+            # Randomly shuffle the order of the symbols in-place.
+            _shuffle_bytes(rng, password)
+            password = password.decode('ascii')
+
+            if verify and __debug__:
+                self._verify(password)
+
+            return password
+
+        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Generate a password.
+        # ===== ===== ===== ===== ===== ===== ===== =====
+
+        # Plan how many symbols to draw from each symbol group.
+        plan = self._plan(rng, length, must_groups, optional_groups)
 
         # ===== ===== ===== ===== ===== ===== ===== =====
-        # Convert the password to a string.
+        # Draw the symbols and convert the password
+        # to a string.
         # ===== ===== ===== ===== ===== ===== ===== =====
 
-        # Randomly shuffle the order of the symbols in-place.
-        self.generator.shuffle(password)
+        # If the symbols are drawn from a single group, e.g. for a PIN
+        # of digits only, they are already in random order, so draw
+        # them directly without shuffling.
+        if len(plan) == 1:
+            population, k = plan[0]
+            byte_tables = draw_tables[population]
+            if byte_tables is None:
+                password = _draw_symbols(rng, population, k)
+            else:
+                password = _draw_from_bytes(rng, *byte_tables, k).decode('ascii')
+
+        # Draw random samples (with replacement) from each group. If all
+        # symbols are ASCII, append them as single bytes to a buffer
+        # in-place, which takes fewer steps than assigning them to slices
+        # of a preallocated buffer.
+        elif all_bytes:
+            password = bytearray()
+            for population, k in plan:
+                password += _draw_from_bytes(rng, *draw_tables[population], k)
+
+            # Randomly shuffle the order of the symbols in-place.
+            _shuffle_bytes(rng, password)
+
+            # Decode the symbols.
+            password = password.decode('ascii')
+
+        # Otherwise, use NumPy for long passwords if it is installed. Its
+        # random generator is seeded from self.generator, so seeding the
+        # latter still makes the passwords reproducible.
+        elif (
+            (np is not None) and
+            (length >= _NUMPY_MIN_LENGTH_NON_ASCII) and
+            (not isinstance(rng, random.SystemRandom))
+        ):
+            np_rng = np.random.default_rng(rng.getrandbits(128))
+            password = _numpy_sample(plan, np_rng)
+
+        # Otherwise, draw groups of ASCII symbols from random bytes and
+        # other groups with _draw_symbols.
+        else:
+            password = []
+            for population, k in plan:
+                byte_tables = draw_tables[population]
+                if byte_tables is None:
+                    password.extend(_draw_symbols(rng, population, k))
+                else:
+                    password.extend(
+                        _draw_from_bytes(rng, *byte_tables, k).decode('ascii')
+                    )
+
+            # Randomly shuffle the order of the symbols in-place.
+            rng.shuffle(password)
 
-        # Concatenate and return the password.
-        password = ''.join(password)
+            # Concatenate the symbols.
+            password = ''.join(password)
 
         # ===== ===== ===== ===== ===== ===== ===== =====
         # Verify whether the result matches the
         # requirements.
         # ===== ===== ===== ===== ===== ===== ===== =====
 
-        if verify:
+        if verify and __debug__:
+            self._verify(password)
 
-            # Check length.
-            if len(password) != self.length:
-                raise ValueError(
-                    f'The length of the generated password\n{password}\n'
-                    f'is {len(password)}, which is different from the '
-                    f'required length of {self.length}.')
+        return password
 
-            # Create a function to check if the password includes or
-            # excludes specific symbols.
-            def _verify_inclusion(pw: str, reference, reference_name: str, mode: str):
+    def generate_many(self, n: int, verify = False) -> list:
 
-                common = set(reference).intersection(pw)
+        """
+        Generate several random passwords with the same settings.
+        Each password follows the same rules as the ones from the
+        generate method, but the settings are checked only once and
+        the symbols of each group are drawn for all passwords at once.
 
-                if (mode == 'must') and (not common):
-                    raise ValueError(
-                        f'The generated password\n{pw}\ndoes not '
-                        f'include {reference_name} when it should. '
-                        f'Please fix the code.'
-                    )
+        Parameters
+        ----------
+        n: int
+            The number of passwords to generate.
 
-                elif (mode == 'never') and common:
-                    raise ValueError(
-                        f'The generated password\n{pw}\nincludes '
-                        f'{reference_name} when it should not. '
-                        f'Please fix the code.'
-                    )
+        verify: bool
+            If True, then check if each generated password complies
+            with the requirements. See the generate method.
 
-            # Apply the function to do the verification.
-            _verify_inclusion(
-                pw = password,
-                reference = ascii_lowercase,
-                reference_name = 'lower-case letters',
-                mode = self.include_lower_case
-            )
+        Returns
+        -------
+        A list of strings containing the generated passwords.
+        """
 
-            _verify_inclusion(
-                pw = password,
-                reference = ascii_uppercase,
-                reference_name = 'upper-case letters',
-                mode = self.include_upper_case
-            )
+        # Check inputs.
+        if not isinstance(n, int):
+            raise TypeError(f'n should be an integer instead of {type(n)}')
+        if n < 0:
+            raise ValueError(f'n should not be negative; it is currently {n}.')
 
-            _verify_inclusion(
-                pw = password,
-                reference = digits,
-                reference_name = 'digits',
-                mode = self.include_digits
-            )
+        rng = self.generator
+        length = self.length
 
-            _verify_inclusion(
-                pw = password,
-                reference = self.special_characters,
-                reference_name = 'special characters',
-                mode = self.include_special_characters
-            )
+        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Plan the passwords
+        # ===== ===== ===== ===== ===== ===== ===== =====
+
+        # Check the settings once for all passwords.
+        (
+            must_groups, optional_groups, draw_tables, _, is_default
+        ) = self._split_groups(length)
+
+        # With the default settings, every password draws one symbol
+        # from each group and the rest from all of them, the same
+        # way as the generate method.
+        if is_default:
+            plan = [
+                (ascii_lowercase, 1),
+                (ascii_uppercase, 1),
+                (digits, 1),
+                (punctuation, 1),
+                (_ALL_DEFAULT, length - 4),
+            ]
+            plans = [plan] * n
+            needs_shuffle = True
+
+        # Otherwise, plan each password. The symbols of a single group
+        # are already in random order, so they are only shuffled if
+        # there are several groups.
+        else:
+            plan_password = self._plan
+            plans = [
+                plan_password(rng, length, must_groups, optional_groups)
+                for _ in range(n)
+            ]
+            needs_shuffle = len(must_groups) + len(optional_groups) > 1
+
+        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Draw the symbols for all passwords
+        # ===== ===== ===== ===== ===== ===== ===== =====
+
+        # Count how many symbols to draw from each group in total.
+        totals = {}
+        for plan in plans:
+            for symbols, k in plan:
+                totals[symbols] = totals.get(symbols, 0) + k
+
+        # Draw the symbols of each group in a single call. Groups of
+        # ASCII symbols are drawn from random bytes, and other groups
+        # are drawn by _draw_symbols.
+        draws = {}
+        for symbols, total in totals.items():
+            byte_tables = draw_tables[symbols]
+            if byte_tables is None:
+                draws[symbols] = _draw_symbols(rng, symbols, total)
+            else:
+                draws[symbols] = _draw_from_bytes(rng, *byte_tables, total)
+
+        # If all symbols are ASCII, build the passwords as bytes.
+        # Otherwise, build them as lists of symbols.
+        is_ascii = all(isinstance(draw, bytes) for draw in draws.values())
+        if not is_ascii:
+            draws = {
+                symbols: draw.decode('ascii') if isinstance(draw, bytes) else draw
+                for symbols, draw in draws.items()
+            }
+
+        # ===== ===== ===== ===== ===== ===== ===== =====
+        # Split the symbols into passwords
+        # ===== ===== ===== ===== ===== ===== ===== =====
+
+        positions = dict.fromkeys(draws, 0)
+
+        # With NumPy, put the symbols of all passwords in an array with
+        # a row per password and shuffle every row in a single call,
+        # the same way as the NumPy path of the generate method.
+        if (
+            is_ascii and
+            (np is not None) and
+            (n * length >= _NUMPY_MIN_LENGTH) and
+            (not isinstance(rng, random.SystemRandom))
+        ):
+
+            # Take the next symbols of each group in each plan.
+            batch = bytearray()
+            for plan in plans:
+                for symbols, k in plan:
+                    position = positions[symbols]
+                    batch += draws[symbols][position:position + k]
+                    positions[symbols] = position + k
+
+            # Shuffle each password independently.
+            size = len(batch) // n
+            if needs_shuffle:
+                np_rng = np.random.default_rng(rng.getrandbits(128))
+                rows = np.frombuffer(batch, dtype = np.uint8).reshape(n, size)
+                batch = np_rng.permuted(rows, axis = 1).tobytes()
+            batch = batch.decode('ascii')
+            passwords = [batch[i * size:(i + 1) * size] for i in range(n)]
+
+        else:
+
+            passwords = []
+            for plan in plans:
+
+                # Take the next symbols of each group in the plan.
+                password = bytearray() if is_ascii else []
+                for symbols, k in plan:
+                    position = positions[symbols]
+                    password += draws[symbols][position:position + k]
+                    positions[symbols] = position + k
+
+                # Randomly shuffle the order of the symbols in-place.
+                if needs_shuffle:
+                    rng.shuffle(password)
+
+                # Convert the password to a string.
+                passwords.append(
+                    password.decode('ascii') if is_ascii else ''.join(password)
+                )
+
+        if verify and __debug__:
+            for password in passwords:
+                self._verify(password)
 
-        return password
\ No newline at end of file
+        return passwords